@@ -0,0 +1,142 @@
+# cython: language_level=3
+"""Compiled direct Vincenty solution"""
+from cython.parallel cimport parallel, prange
+from libc.math cimport atan2, cos, fabs, fmod, M_PI, sin, sqrt, tan
+
+import numpy as np
+
+from ellipsoid import WGS84
+
+cdef double DEG_TO_RAD = M_PI / 180
+cdef double RAD_TO_DEG = 180 / M_PI
+# Same as geodesic_calc.SIGMA_TOLERANCE, geodesic_calc.MAX_ITERATIONS
+cdef double SIGMA_TOLERANCE = 1e-10
+cdef int MAX_ITERATIONS = 8
+
+
+cdef inline (double, double, double) _precompute_center(double lat1, double f) noexcept nogil:
+    """Return tan, cos, sin of the reduced latitude (U1) of the initial point,
+    shared by all azimuths from the same initial point.
+
+    :param lat1: latitude of the initial point in decimal degrees format
+    :param f: ellipsoid flattening
+    """
+    # U1 - reduced latitude
+    cdef double tan_u1 = (1 - f) * tan(lat1 * DEG_TO_RAD)
+    cdef double cos_u1 = 1 / sqrt(1 + tan_u1 * tan_u1)
+    return tan_u1, cos_u1, tan_u1 * cos_u1
+
+
+cdef (double, double) _vincenty_from_center((double, double, double) center,
+                                            double lon1,
+                                            double az,
+                                            double dist,
+                                            double a,
+                                            double b,
+                                            double f) noexcept nogil:
+    """Direct solution for the initial point terms returned by the `_precompute_center`."""
+    cdef double tan_u1 = center[0], cos_u1 = center[1], sin_u1 = center[2]
+    cdef double alpha1 = az * DEG_TO_RAD
+    cdef double sin_alpha1 = sin(alpha1)
+    cdef double cos_alpha1 = cos(alpha1)
+
+    # sigma1 - angular distance on the sphere from the equator to initial point
+    cdef double sigma1 = atan2(tan_u1, cos_alpha1)
+
+    # sin_alpha - azimuth of the geodesic at the equator
+    cdef double sin_alpha = cos_u1 * sin_alpha1
+    cdef double cos_sq_alpha = 1 - sin_alpha * sin_alpha
+    cdef double u_sq = cos_sq_alpha * (a * a - b * b) / (b * b)
+    cdef double A = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
+    cdef double B = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+
+    cdef double sigma = dist / (b * A)
+    cdef double sigmap
+    cdef double sin_sigma = 0, cos_sigma = 0, cos2sigma_m = 0, d_sigma
+    cdef int i
+
+    for i in range(MAX_ITERATIONS):
+        cos2sigma_m = cos(2 * sigma1 + sigma)
+        sin_sigma = sin(sigma)
+        cos_sigma = cos(sigma)
+        d_sigma = B * sin_sigma * (cos2sigma_m + B / 4 * (
+                    cos_sigma * (-1 + 2 * cos2sigma_m * cos2sigma_m) - B / 6 * cos2sigma_m * (
+                        -3 + 4 * sin_sigma * sin_sigma) * (-3 + 4 * cos2sigma_m * cos2sigma_m)))
+        sigmap = sigma
+        sigma = dist / (b * A) + d_sigma
+        if fabs(sigma - sigmap) < SIGMA_TOLERANCE:
+            break
+
+    cdef double var_aux = sin_u1 * sin_sigma - cos_u1 * cos_sigma * cos_alpha1  # Auxiliary variable
+
+    # Latitude of the end point in radians
+    cdef double lat2 = atan2(sin_u1 * cos_sigma + cos_u1 * sin_sigma * cos_alpha1,
+                             (1 - f) * sqrt(sin_alpha * sin_alpha + var_aux * var_aux))
+
+    cdef double lamb = atan2(sin_sigma * sin_alpha1, cos_u1 * cos_sigma - sin_u1 * sin_sigma * cos_alpha1)
+    cdef double C = f / 16 * cos_sq_alpha * (4 + f * (4 - 3 * cos_sq_alpha))
+    cdef double L = lamb - (1 - C) * f * sin_alpha * (
+                sigma + C * sin_sigma * (cos2sigma_m + C * cos_sigma * (-1 + 2 * cos2sigma_m * cos2sigma_m)))
+
+    # Longitude of the end point in radians
+    cdef double lon2 = fmod(lon1 * DEG_TO_RAD + L + 3 * M_PI, 2 * M_PI) - M_PI
+
+    return lon2 * RAD_TO_DEG, lat2 * RAD_TO_DEG
+
+
+cpdef (double, double) vincenty_direct(double lon1,
+                                       double lat1,
+                                       double az,
+                                       double dist,
+                                       double a,
+                                       double b,
+                                       double f) noexcept nogil:
+    """Computes the longitude and latitude of the second point based on longitude, latitude
+    of the first point and distance and azimuth from first point to second point.
+    Direct translation of the `geodesic_calc.vincenty_direct_solution`.
+
+    :param lon1: longitude of the initial point in decimal degrees format
+    :param lat1: latitude of the initial point in decimal degrees format
+    :param az: azimuth from the initial point to the end point in decimal degrees format
+    :param dist: distance from first point to second point; meters
+    :param a: ellipsoid major semi-axis
+    :param b: ellipsoid minor semi-axis
+    :param f: ellipsoid flattening
+    :return: end point longitude, latitude in decimal degrees format
+    """
+    return _vincenty_from_center(_precompute_center(lat1, f), lon1, az, dist, a, b, f)
+
+
+def vincenty_direct_array(double lon0,
+                          double lat0,
+                          azimuths_deg,
+                          double distance,
+                          ellipsoid=WGS84):
+    """Compiled counterpart of the `geodesic_calc.vincenty_direct_vec`,
+    end points are computed in parallel, without holding the GIL.
+
+    :param lon0: longitude of the initial point in decimal degrees format
+    :param lat0: latitude of the initial point in decimal degrees format
+    :param azimuths_deg: azimuths from the initial point to the end points in decimal degrees format
+    :param distance: distance from the initial point to the end points; meters
+    :param ellipsoid:
+    :return: longitudes and latitudes of the end points in decimal degrees format
+    """
+    cdef double a, b, f
+    a, b, f = ellipsoid
+    cdef double[::1] azs = np.ascontiguousarray(azimuths_deg, dtype=np.float64)
+    cdef Py_ssize_t i, n = azs.shape[0]
+    lon = np.empty(n, dtype=np.float64)
+    lat = np.empty(n, dtype=np.float64)
+    cdef double[::1] lon_view = lon
+    cdef double[::1] lat_view = lat
+    cdef (double, double, double) center = _precompute_center(lat0, f)
+    cdef (double, double) p
+
+    with nogil, parallel():
+        for i in prange(n):
+            p = _vincenty_from_center(center, lon0, azs[i], distance, a, b, f)
+            lon_view[i] = p[0]
+            lat_view[i] = p[1]
+
+    return lon, lat
@@ -0,0 +1,115 @@
+"""Direct Vincenty solution for circles on GPU (requires CuPy)"""
+import cupy as cp
+import numpy as np
+
+from _types import Ellipsoid
+from ellipsoid import WGS84
+from geodesic_calc import MAX_ITERATIONS, SIGMA_TOLERANCE
+
+_THREADS_PER_BLOCK = 256
+
+# One thread per circle vertex:
+# thread i computes vertex i % 360 (azimuth in degrees) of the circle i / 360
+_CIRCLES_KERNEL = cp.RawKernel(r"""
+extern "C" __global__
+void vincenty_direct_circles(const double* lon0,
+                             const double* lat0,
+                             const double* dist,
+                             const int n,
+                             const double a,
+                             const double b,
+                             const double f,
+                             const double sigma_tolerance,
+                             const int max_iterations,
+                             double* out)
+{
+    const double PI = 3.141592653589793;
+    const int tid = blockDim.x * blockIdx.x + threadIdx.x;
+    if (tid >= n * 360) {
+        return;
+    }
+    const int c = tid / 360;
+
+    const double alpha1 = (tid % 360) * PI / 180;
+    const double sin_alpha1 = sin(alpha1);
+    const double cos_alpha1 = cos(alpha1);
+
+    // U1 - reduced latitude
+    const double tan_u1 = (1 - f) * tan(lat0[c] * PI / 180);
+    const double cos_u1 = 1 / sqrt(1 + tan_u1 * tan_u1);
+    const double sin_u1 = tan_u1 * cos_u1;
+
+    // sigma1 - angular distance on the sphere from the equator to initial point
+    const double sigma1 = atan2(tan_u1, cos_alpha1);
+
+    // sin_alpha - azimuth of the geodesic at the equator
+    const double sin_alpha = cos_u1 * sin_alpha1;
+    const double cos_sq_alpha = 1 - sin_alpha * sin_alpha;
+    const double u_sq = cos_sq_alpha * (a * a - b * b) / (b * b);
+    const double A = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)));
+    const double B = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)));
+
+    double sigma = dist[c] / (b * A);
+    double sigmap, d_sigma;
+    double sin_sigma = 0, cos_sigma = 0, cos2sigma_m = 0;
+
+    for (int i = 0; i < max_iterations; i++) {
+        cos2sigma_m = cos(2 * sigma1 + sigma);
+        sin_sigma = sin(sigma);
+        cos_sigma = cos(sigma);
+        d_sigma = B * sin_sigma * (cos2sigma_m + B / 4 * (
+                    cos_sigma * (-1 + 2 * cos2sigma_m * cos2sigma_m) - B / 6 * cos2sigma_m * (
+                        -3 + 4 * sin_sigma * sin_sigma) * (-3 + 4 * cos2sigma_m * cos2sigma_m)));
+        sigmap = sigma;
+        sigma = dist[c] / (b * A) + d_sigma;
+        if (fabs(sigma - sigmap) < sigma_tolerance) {
+            break;
+        }
+    }
+
+    const double var_aux = sin_u1 * sin_sigma - cos_u1 * cos_sigma * cos_alpha1;  // Auxiliary variable
+
+    // Latitude of the end point in radians
+    const double lat2 = atan2(sin_u1 * cos_sigma + cos_u1 * sin_sigma * cos_alpha1,
+                              (1 - f) * sqrt(sin_alpha * sin_alpha + var_aux * var_aux));
+
+    const double lamb = atan2(sin_sigma * sin_alpha1, cos_u1 * cos_sigma - sin_u1 * sin_sigma * cos_alpha1);
+    const double C = f / 16 * cos_sq_alpha * (4 + f * (4 - 3 * cos_sq_alpha));
+    const double L = lamb - (1 - C) * f * sin_alpha * (
+                sigma + C * sin_sigma * (cos2sigma_m + C * cos_sigma * (-1 + 2 * cos2sigma_m * cos2sigma_m)));
+
+    // Longitude of the end point in radians
+    const double lon2 = fmod(lon0[c] * PI / 180 + L + 3 * PI, 2 * PI) - PI;
+
+    out[2 * tid] = lon2 * 180 / PI;
+    out[2 * tid + 1] = lat2 * 180 / PI;
+}
+""", "vincenty_direct_circles")
+
+
+def vincenty_direct_circles_gpu(centers: np.ndarray,
+                                radii: np.ndarray,
+                                ellipsoid: Ellipsoid = WGS84) -> np.ndarray:
+    """Return coordinates of circles (vertex every 1 degree of azimuth) calculated on GPU.
+
+    :param centers: Circle centers, array of shape (N, 2) with lon, lat columns
+    :param radii: Circle radii, array of shape (N,)
+    :param ellipsoid:
+    :return: Circles coordinates, array of shape (N * 360, 2) with lon, lat columns
+    """
+    a, b, f = ellipsoid
+    centers = np.asarray(centers, dtype=np.float64)
+    n = len(centers)
+    lon0 = cp.asarray(np.ascontiguousarray(centers[:, 0]))
+    lat0 = cp.asarray(np.ascontiguousarray(centers[:, 1]))
+    dist = cp.asarray(np.asarray(radii, dtype=np.float64))
+    out = cp.empty((n * 360, 2), dtype=cp.float64)
+
+    blocks = (n * 360 + _THREADS_PER_BLOCK - 1) // _THREADS_PER_BLOCK
+    _CIRCLES_KERNEL(
+        (blocks,),
+        (_THREADS_PER_BLOCK,),
+        (lon0, lat0, dist, np.int32(n), np.float64(a), np.float64(b), np.float64(f),
+         np.float64(SIGMA_TOLERANCE), np.int32(MAX_ITERATIONS), out)
+    )
+    return cp.asnumpy(out)
@@ -1,6 +1,8 @@
 """Functions to calculate airspace geometries"""
 from math import ceil, floor
 
+import numpy as np
+import shapely
 from shapely.geometry import Polygon
 
 from _exceptions import RadiiError
@@ -9,60 +11,100 @@ from _types import (
     GeographicCoordinates,
     Meters,
 )
-from geodesic_calc import vincenty_direct_solution
+from geodesic_calc import vincenty_direct_vec
+
+try:
+    # Compiled extension, built with: python setup.py build_ext --inplace
+    from _vincenty import vincenty_direct_array
+except ImportError:
+    vincenty_direct_array = vincenty_direct_vec
+
+try:
+    from _vincenty_gpu import vincenty_direct_circles_gpu
+except ImportError:
+    vincenty_direct_circles_gpu = None
+
+# Azimuths of the circle vertices
+_AZIMUTHS_FULL = np.arange(360, dtype=np.float64)
 
 
 def _central_int_angle(azimuth_from: DecimalDegrees,
                        azimuth_to: DecimalDegrees) -> int | Exception:
-    """Return the central angle between two azimuths.
+    """Return the central angle between two azimuths,
+    beginning is rounded down, end is rounded up to the full degrees.
 
     :param azimuth_from: Beginning of the angle
     :param azimuth_to: End of the angle
     :return: central angle
     """
-    a = ceil(azimuth_to) - floor(azimuth_from)
-    return a % 360
+    return (ceil(azimuth_to) - floor(azimuth_from)) % 360
 
 
 def _circle_coords(center: GeographicCoordinates,
-                   radius: Meters) -> list[GeographicCoordinates]:
-    """Return list of coordinates that form circle.
+                   radius: Meters) -> np.ndarray:
+    """Return array of coordinates that form circle.
 
     :param center: Circle center coordinates
     :param radius: Circle radius
-    :return: Circle coordinates
+    :return: Circle coordinates, array of shape (360, 2) with lon, lat columns
     """
-    return [vincenty_direct_solution(center, i, radius) for i in range(360)]
+    coords = np.empty((360, 2), dtype=np.float64)
+    coords[:, 0], coords[:, 1] = vincenty_direct_array(center.lon, center.lat,
+                                                       _AZIMUTHS_FULL, radius)
+    return coords
 
 
 def _arc_coords(center: GeographicCoordinates,
                 radius: Meters,
                 azimuth_from: DecimalDegrees,
-                azimuth_to: DecimalDegrees) -> list[GeographicCoordinates]:
-    """Return list of coordinates that from arc.
+                azimuth_to: DecimalDegrees) -> np.ndarray:
+    """Return array of coordinates that from arc.
 
     :param center: Arc center coordinates
     :param radius: Arc radius
     :param azimuth_from: Beginning azimuth of the arc
     :param azimuth_to: End azimuth of the arc
-    :return: Arc coordinates
+    :return: Arc coordinates, array of shape (N, 2) with lon, lat columns
     """
-    arc_begin = vincenty_direct_solution(center, azimuth_from, radius)
-    arc_end = vincenty_direct_solution(center, azimuth_to, radius)
-
-    coords = [arc_begin]
     angle = _central_int_angle(azimuth_from, azimuth_to)
-    azm_ = floor(azimuth_from)
-    for i in range(1, angle):
-        azm = azm_ + i
-        if azm > 360:
-            azm -= 360
-        p = vincenty_direct_solution(center, azm, radius)
-        coords.append(p)
-    coords.append(arc_end)
+    azimuths = np.concatenate((
+        [azimuth_from],
+        (floor(azimuth_from) + np.arange(1, angle)) % 360,
+        [azimuth_to]
+    ))
+    coords = np.empty((azimuths.size, 2), dtype=np.float64)
+    coords[:, 0], coords[:, 1] = vincenty_direct_array(center.lon, center.lat, azimuths, radius)
+    return coords
+
+
+def _circles_coords(centers: np.ndarray,
+                    radii: np.ndarray) -> np.ndarray:
+    """Return coordinates of many circles, calculated at once.
+
+    :param centers: Circle centers, array of shape (N, 2) with lon, lat columns
+    :param radii: Circle radii, array of shape (N,)
+    :return: Circles coordinates, array of shape (N * 360, 2) with lon, lat columns
+    """
+    centers = np.asarray(centers, dtype=np.float64)
+    n = len(centers)
+    coords = np.empty((n * 360, 2), dtype=np.float64)
+    coords[:, 0], coords[:, 1] = vincenty_direct_vec(np.repeat(centers[:, 0], 360),
+                                                     np.repeat(centers[:, 1], 360),
+                                                     np.tile(_AZIMUTHS_FULL, n),
+                                                     np.repeat(radii, 360))
     return coords
 
 
+def _circles_rings(circles_coords: np.ndarray) -> np.ndarray:
+    """Return circles as linear rings.
+
+    :param circles_coords: Circles coordinates, array of shape (N * 360, 2) with lon, lat columns
+    :return: Circles linear rings
+    """
+    n = len(circles_coords) // 360
+    return shapely.linearrings(circles_coords, indices=np.repeat(np.arange(n), 360))
+
+
 def circle(center: GeographicCoordinates,
            radius: Meters) -> Polygon:
     """Return geometry for airspace with circle shape.
@@ -87,10 +129,8 @@ def circular_sector(center: GeographicCoordinates,
     :param azimuth_to: Final azimuth of the circular sector
     :return: Circular sector polygon
     """
-
-    coords = [center]
     arc = _arc_coords(center, radius, azimuth_from, azimuth_to)
-    coords.extend(arc)
+    coords = np.concatenate(([center], arc), axis=0)
     return Polygon(coords)
 
 
@@ -146,6 +186,48 @@ def ring_sector(center: GeographicCoordinates,
 
     outer_arc = _arc_coords(center, outer_radius, azimuth_from, azimuth_to)
     #  Revers inner arc, to make clock-wise coordinates order
-    inner_arc = list(reversed(_arc_coords(center, inner_radius, azimuth_from, azimuth_to)))
-    coords = outer_arc + inner_arc
+    inner_arc = _arc_coords(center, inner_radius, azimuth_from, azimuth_to)[::-1]
+    coords = np.concatenate((outer_arc, inner_arc), axis=0)
     return Polygon(coords)
+
+
+def circles(centers: np.ndarray,
+            radii: np.ndarray) -> np.ndarray:
+    """Return geometries for many airspaces with circle shape.
+
+    :param centers: Centers of the circles, array of shape (N, 2) with lon, lat columns
+    :param radii: Circles radii, array of shape (N,)
+    :return: Circle polygons
+    """
+    return shapely.polygons(_circles_rings(_circles_coords(centers, radii)))
+
+
+def rings(centers: np.ndarray,
+          inner_radii: np.ndarray,
+          outer_radii: np.ndarray) -> np.ndarray | ValueError:
+    """Return geometries for many airspaces with ring shape.
+
+    :param centers: Centers of the rings, array of shape (N, 2) with lon, lat columns
+    :param inner_radii: Rings inner radii, array of shape (N,)
+    :param outer_radii: Rings outer radii, array of shape (N,)
+    :return: Ring polygons
+    """
+    if np.any(np.asarray(inner_radii) >= np.asarray(outer_radii)):
+        raise ValueError("Inner radius must be less than outer radius")
+    inner_circles = _circles_rings(_circles_coords(centers, inner_radii))
+    outer_circles = _circles_rings(_circles_coords(centers, outer_radii))
+    return shapely.polygons(outer_circles, holes=inner_circles[:, np.newaxis])
+
+
+def circles_gpu(centers: np.ndarray,
+                radii: np.ndarray) -> np.ndarray | ImportError:
+    """Return geometries for many airspaces with circle shape,
+    coordinates are calculated on GPU (requires CuPy).
+
+    :param centers: Centers of the circles, array of shape (N, 2) with lon, lat columns
+    :param radii: Circles radii, array of shape (N,)
+    :return: Circle polygons
+    """
+    if vincenty_direct_circles_gpu is None:
+        raise ImportError("CuPy is required to calculate circles on GPU")
+    return shapely.polygons(_circles_rings(vincenty_direct_circles_gpu(centers, radii)))
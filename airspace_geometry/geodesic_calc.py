@@ -3,7 +3,6 @@ from math import (
     atan2,
     cos,
     degrees,
-    fabs,
     pi,
     radians,
     sqrt,
@@ -11,6 +10,8 @@ from math import (
     tan
 )
 
+import numpy as np
+
 from _types import (
     Ellipsoid,
     DecimalDegrees,
@@ -19,6 +20,100 @@ from _types import (
 )
 from ellipsoid import WGS84
 
+try:
+    from numba import njit
+except ImportError:
+    def njit(*_args, **_kwargs):
+        """Numba is not installed: functions are not compiled, run as plain Python"""
+        return lambda func: func
+
+# Iteration of sigma in the direct solution ends when its change is below the tolerance
+# (1e-10 rad ~ 0.6 mm), near-antipodal cases that do not converge take the last approximation
+SIGMA_TOLERANCE = 1e-10
+MAX_ITERATIONS = 8
+
+
+@njit(cache=True, fastmath=True, error_model="numpy")
+def _precompute_center(lat1: float,
+                       f: float) -> tuple[float, float, float]:
+    """Return terms of the direct solution that depend only on the initial point latitude,
+    so they can be shared by all azimuths from the same initial point.
+
+    :param lat1: latitude of the initial point in radians
+    :param f: ellipsoid flattening
+    :return: tan, cos, sin of the reduced latitude (U1) of the initial point
+    """
+    # U1 - reduced latitude
+    tan_u1 = (1 - f) * tan(lat1)
+    cos_u1 = 1 / sqrt(1 + tan_u1 * tan_u1)
+    sin_u1 = tan_u1 * cos_u1
+    return tan_u1, cos_u1, sin_u1
+
+
+@njit(cache=True, fastmath=True, error_model="numpy")
+def _vincenty_from_center(center: tuple[float, float, float],
+                          lon1: float,
+                          alpha1: float,
+                          distance: float,
+                          a: float,
+                          b: float,
+                          f: float) -> tuple[float, float]:
+    """Compiled body of the `vincenty_direct_solution`.
+
+    :param center: initial point terms returned by the `_precompute_center`
+    :param lon1: longitude of the initial point in radians
+    :param alpha1: azimuth from the initial point to the end point in radians
+    :param distance: distance from first point to second point; meters
+    :param a: ellipsoid major semi-axis
+    :param b: ellipsoid minor semi-axis
+    :param f: ellipsoid flattening
+    :return: end point longitude, latitude in decimal degrees format
+    """
+    tan_u1, cos_u1, sin_u1 = center
+    sin_alpha1 = sin(alpha1)
+    cos_alpha1 = cos(alpha1)
+
+    # sigma1 - angular distance on the sphere from the equator to initial point
+    sigma1 = atan2(tan_u1, cos_alpha1)
+
+    # sin_alpha - azimuth of the geodesic at the equator
+    sin_alpha = cos_u1 * sin_alpha1
+    cos_sq_alpha = 1 - sin_alpha * sin_alpha
+    u_sq = cos_sq_alpha * (a * a - b * b) / (b * b)
+    A = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
+    B = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+
+    sigma = distance / (b * A)
+    sin_sigma, cos_sigma, cos2sigma_m = 0.0, 0.0, 0.0
+
+    for _ in range(MAX_ITERATIONS):
+        cos2sigma_m = cos(2 * sigma1 + sigma)
+        sin_sigma = sin(sigma)
+        cos_sigma = cos(sigma)
+        d_sigma = B * sin_sigma * (cos2sigma_m + B / 4 * (
+                    cos_sigma * (-1 + 2 * cos2sigma_m * cos2sigma_m) - B / 6 * cos2sigma_m * (
+                        -3 + 4 * sin_sigma * sin_sigma) * (-3 + 4 * cos2sigma_m * cos2sigma_m)))
+        sigmap = sigma
+        sigma = distance / (b * A) + d_sigma
+        if abs(sigma - sigmap) < SIGMA_TOLERANCE:
+            break
+
+    var_aux = sin_u1 * sin_sigma - cos_u1 * cos_sigma * cos_alpha1  # Auxiliary variable
+
+    # Latitude of the end point in radians
+    lat2 = atan2(sin_u1 * cos_sigma + cos_u1 * sin_sigma * cos_alpha1,
+                 (1 - f) * sqrt(sin_alpha * sin_alpha + var_aux * var_aux))
+
+    lamb = atan2(sin_sigma * sin_alpha1, cos_u1 * cos_sigma - sin_u1 * sin_sigma * cos_alpha1)
+    C = f / 16 * cos_sq_alpha * (4 + f * (4 - 3 * cos_sq_alpha))
+    L = lamb - (1 - C) * f * sin_alpha * (
+                sigma + C * sin_sigma * (cos2sigma_m + C * cos_sigma * (-1 + 2 * cos2sigma_m * cos2sigma_m)))
+
+    # Longitude of the end point in radians
+    lon2 = (lon1 + L + 3 * pi) % (2 * pi) - pi
+
+    return degrees(lon2), degrees(lat2)
+
 
 def vincenty_direct_solution(initial_point: GeographicCoordinates,
                              initial_azimuth: DecimalDegrees,
@@ -36,20 +131,47 @@ def vincenty_direct_solution(initial_point: GeographicCoordinates,
     :return: end point in decimal degrees format
     """
     a, b, f = ellipsoid
-    lon1 = radians(initial_point.lon)
-    lat1 = radians(initial_point.lat)
-    alpha1 = radians(initial_azimuth)
+    lon_end, lat_end = _vincenty_from_center(_precompute_center(radians(initial_point.lat), f),
+                                             radians(initial_point.lon),
+                                             radians(initial_azimuth),
+                                             float(distance),
+                                             a, b, f)
+    return GeographicCoordinates(lon=lon_end, lat=lat_end)
 
-    sin_alpha1 = sin(alpha1)
-    cos_alpha1 = cos(alpha1)
+
+def vincenty_direct_vec(lon0: DecimalDegrees | np.ndarray,
+                        lat0: DecimalDegrees | np.ndarray,
+                        azimuths_deg: np.ndarray,
+                        distance: Meters | np.ndarray,
+                        ellipsoid: Ellipsoid = WGS84) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized version of the `vincenty_direct_solution`.
+    Computes many end points at once,
+    all the points are iterated in lockstep until the whole array converges.
+    Initial point and distance can be scalars or arrays broadcastable against azimuths.
+
+    :param lon0: longitude of the initial point(s) in decimal degrees format
+    :param lat0: latitude of the initial point(s) in decimal degrees format
+    :param azimuths_deg: azimuths from the initial point(s) to the end points
+        in decimal degrees format
+    :param distance: distance(s) from the initial point(s) to the end points; meters
+    :param ellipsoid:
+    :return: longitudes and latitudes of the end points in decimal degrees format
+    """
+    a, b, f = ellipsoid
+    lon1 = np.radians(lon0)
+    lat1 = np.radians(lat0)
+    alpha1 = np.radians(np.asarray(azimuths_deg, dtype=np.float64))
+
+    sin_alpha1 = np.sin(alpha1)
+    cos_alpha1 = np.cos(alpha1)
 
     # U1 - reduced latitude
-    tan_u1 = (1 - f) * tan(lat1)
-    cos_u1 = 1 / sqrt(1 + tan_u1 * tan_u1)
+    tan_u1 = (1 - f) * np.tan(lat1)
+    cos_u1 = 1 / np.sqrt(1 + tan_u1 * tan_u1)
     sin_u1 = tan_u1 * cos_u1
 
     # sigma1 - angular distance on the sphere from the equator to initial point
-    sigma1 = atan2(tan_u1, cos(alpha1))
+    sigma1 = np.arctan2(tan_u1, cos_alpha1)
 
     # sin_alpha - azimuth of the geodesic at the equator
     sin_alpha = cos_u1 * sin_alpha1
@@ -59,34 +181,32 @@ def vincenty_direct_solution(initial_point: GeographicCoordinates,
     B = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
 
     sigma = distance / (b * A)
-    sigmap = 1
     sin_sigma, cos_sigma, cos2sigma_m = None, None, None
 
-    while fabs(sigma - sigmap) > 1e-12:
-        cos2sigma_m = cos(2 * sigma1 + sigma)
-        sin_sigma = sin(sigma)
-        cos_sigma = cos(sigma)
+    for _ in range(MAX_ITERATIONS):
+        cos2sigma_m = np.cos(2 * sigma1 + sigma)
+        sin_sigma = np.sin(sigma)
+        cos_sigma = np.cos(sigma)
         d_sigma = B * sin_sigma * (cos2sigma_m + B / 4 * (
                     cos_sigma * (-1 + 2 * cos2sigma_m * cos2sigma_m) - B / 6 * cos2sigma_m * (
                         -3 + 4 * sin_sigma * sin_sigma) * (-3 + 4 * cos2sigma_m * cos2sigma_m)))
         sigmap = sigma
         sigma = distance / (b * A) + d_sigma
+        if np.all(np.abs(sigma - sigmap) < SIGMA_TOLERANCE):
+            break
 
     var_aux = sin_u1 * sin_sigma - cos_u1 * cos_sigma * cos_alpha1  # Auxiliary variable
 
-    # Latitude of the end point in radians
-    lat2 = atan2(sin_u1 * cos_sigma + cos_u1 * sin_sigma * cos_alpha1,
-                 (1 - f) * sqrt(sin_alpha * sin_alpha + var_aux * var_aux))
+    # Latitude of the end points in radians
+    lat2 = np.arctan2(sin_u1 * cos_sigma + cos_u1 * sin_sigma * cos_alpha1,
+                      (1 - f) * np.sqrt(sin_alpha * sin_alpha + var_aux * var_aux))
 
-    lamb = atan2(sin_sigma * sin_alpha1, cos_u1 * cos_sigma - sin_u1 * sin_sigma * cos_alpha1)
+    lamb = np.arctan2(sin_sigma * sin_alpha1, cos_u1 * cos_sigma - sin_u1 * sin_sigma * cos_alpha1)
     C = f / 16 * cos_sq_alpha * (4 + f * (4 - 3 * cos_sq_alpha))
     L = lamb - (1 - C) * f * sin_alpha * (
                 sigma + C * sin_sigma * (cos2sigma_m + C * cos_sigma * (-1 + 2 * cos2sigma_m * cos2sigma_m)))
 
-    # Longitude of the end point in radians
+    # Longitude of the end points in radians
     lon2 = (lon1 + L + 3 * pi) % (2 * pi) - pi
 
-    lon_end = degrees(lon2)
-    lat_end = degrees(lat2)
-
-    return GeographicCoordinates(lon=lon_end, lat=lat_end)
+    return np.degrees(lon2), np.degrees(lat2)
@@ -0,0 +1,71 @@
+"""Build the compiled direct Vincenty solution
+(optional, pure Python implementation is used without it):
+
+    python setup.py build_ext --inplace
+"""
+import os
+import tempfile
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CompileError, LinkError
+
+_OPENMP_CHECK = """#include <omp.h>
+int main(void) { return omp_get_max_threads() > 0 ? 0 : 1; }
+"""
+
+
+def openmp_flags(compiler) -> tuple[list[str], list[str]]:
+    """Return OpenMP compile and link flags for the compiler,
+    no flags when OpenMP is not available (example Apple clang without libomp).
+
+    :param compiler: compiler used to build the extension
+    :return: compile flags, link flags
+    """
+    if compiler.compiler_type == "msvc":
+        return ["/openmp"], []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        src = os.path.join(tmp_dir, "openmp_check.c")
+        with open(src, "w", encoding="utf-8") as f:
+            f.write(_OPENMP_CHECK)
+        try:
+            objects = compiler.compile([src], output_dir=tmp_dir, extra_postargs=["-fopenmp"])
+            compiler.link_executable(objects, os.path.join(tmp_dir, "openmp_check"),
+                                     extra_postargs=["-fopenmp"])
+        except (CompileError, LinkError):
+            return [], []
+    return ["-fopenmp"], ["-fopenmp"]
+
+
+class BuildExt(build_ext):
+    """Build extensions with OpenMP when the compiler supports it, serial prange loops otherwise"""
+    def build_extensions(self):
+        compile_args, link_args = openmp_flags(self.compiler)
+        if not compile_args:
+            print("OpenMP not available, building without it")
+        for ext in self.extensions:
+            ext.extra_compile_args += compile_args
+            ext.extra_link_args += link_args
+        super().build_extensions()
+
+
+extensions = [
+    Extension(
+        "_vincenty",
+        ["_vincenty.pyx"]
+    )
+]
+
+setup(
+    name="airspace_geometry",
+    cmdclass={"build_ext": BuildExt},
+    ext_modules=cythonize(
+        extensions,
+        compiler_directives={
+            "boundscheck": False,
+            "cdivision": True,
+            "wraparound": False
+        }
+    )
+)
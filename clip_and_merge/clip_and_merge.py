@@ -1,7 +1,11 @@
 """Clip data from multiple files to given area of interest and
 save it into one geopackage file.
 """
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import os
 from pathlib import Path
 
 from dacite import (
@@ -11,7 +15,13 @@ from dacite import (
 )
 from fiona.errors import DriverError
 import geopandas as gpd
-from yaml import safe_load
+import pyogrio
+from yaml import load as yaml_load
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
 
 @dataclass(frozen=True)
@@ -40,7 +50,7 @@ def load_config() -> Configuration | Exception:
     """Return parsed config"""
     try:
         with open("config.yml", "r", encoding="utf-8") as f:
-            content = safe_load(f)
+            content = yaml_load(f, Loader=_Loader)
             return from_dict(
                 data_class=Configuration,
                 data=content
@@ -51,6 +61,46 @@ def load_config() -> Configuration | Exception:
         raise ValueError(f"Config file error: {e}") from e
 
 
+def clip_file(path: Path,
+              aoi: gpd.GeoSeries) -> gpd.GeoDataFrame:
+    """Return data from the file clipped to the area of interest.
+
+    :param path: path to the data file
+    :param aoi: area of interest
+    :return: clipped data
+    """
+    # bbox is a cheap, indexed prefilter, exact geometry work is done once, by clip;
+    # pyogrio engine does not reproject bbox, it has to be in the file CRS
+    crs = pyogrio.read_info(path)["crs"]
+    bbox = tuple((aoi if crs is None else aoi.to_crs(crs)).total_bounds)
+    gdf = gpd.read_file(path, bbox=bbox, engine="pyogrio")
+    return gdf.clip(aoi)
+
+
+def clip_files(paths: list[Path],
+               aoi: gpd.GeoSeries,
+               max_workers: int) -> Iterator[tuple[Path, gpd.GeoDataFrame]]:
+    """Yield data from the files clipped to the area of interest, in the files order.
+    Files are clipped in parallel threads, at most max_workers + 1 files are clipped ahead,
+    so clipped data waiting to be consumed does not grow with the number of files.
+
+    :param paths: paths to the data files
+    :param aoi: area of interest
+    :param max_workers: number of threads
+    :return: path to the data file, clipped data
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for path in paths:
+            pending.append((path, executor.submit(clip_file, path, aoi)))
+            if len(pending) > max_workers:
+                done_path, future = pending.popleft()
+                yield done_path, future.result()
+        while pending:
+            done_path, future = pending.popleft()
+            yield done_path, future.result()
+
+
 def main():
     """Main script loop"""
     # TODO: different CRS input, output
@@ -58,16 +108,17 @@ def main():
     aoi_gs = gpd.GeoSeries.from_wkt(data=[config.aoi.geometry],
                                     crs=config.aoi.epsg_code)
     data_path = Path(config.data_paths.dir_input)
-    files = data_path.glob("**/*")
-    for f in files:
-        if f.is_dir():
-            continue
-
-        if f.suffix in config.file_ext:
-            gdf = gpd.read_file(f, mask=aoi_gs)
-            layer = gdf.clip(aoi_gs)
-            print(f"File {f} clipped")
-            layer.to_file(config.data_paths.file_output, layer=f"{f.stem}")
+    file_ext = frozenset(config.file_ext)
+    # single walk of the input tree, sorted - deterministic layers order
+    files = sorted(f for f in data_path.rglob("*") if f.suffix in file_ext and not f.is_dir())
+    # pyogrio (GDAL) reads and GEOS clipping release the GIL,
+    # output is written sequentially (single writer)
+    for f, layer in clip_files(files, aoi_gs, os.cpu_count()):
+        print(f"File {f} clipped")
+        layer.to_file(config.data_paths.file_output,
+                      layer=f"{f.stem}",
+                      driver="GPKG",
+                      engine="pyogrio")
 
 
 if __name__ == "__main__":
@@ -8,9 +8,14 @@ from dacite import (
     WrongTypeError
 )
 import geopandas as gpd
-from yaml import safe_load
-from numpy import arange, linspace, full
-from shapely import LineString
+from numpy import arange, column_stack, linspace, repeat, tile
+from shapely import LineString, linestrings
+from yaml import load as yaml_load
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
 DEGREE = 1
 _STEP = 0.1 * DEGREE
@@ -39,7 +44,7 @@ def load_config(path: str = "config.yml") -> Configuration | Exception:
     """
     try:
         with open(path, "r", encoding="utf-8") as f:
-            content = safe_load(f)
+            content = yaml_load(f, Loader=_Loader)
             return from_dict(
                 data_class=Configuration,
                 data=content
@@ -79,16 +84,13 @@ def meridians(lon_from: int | float,
     except Exception as e:
         raise ValueError(f"Invalid longitude range: {e}") from e
 
-    labels, meridians_ = [], []
-    coords_lat = linspace(start=lat_from, stop=lat_to, num=num, endpoint=True).tolist()
-    for lon in arange(lon_from, lon_to + step, step):
-        labels.append(f"LON {lon}")
-        coords_lon = full((len(coords_lat)), lon).tolist()
-        coords_meridian = list(zip(coords_lon, coords_lat))
-        meridian = LineString(coords_meridian)
-        meridians_.append(meridian)
+    lats = linspace(start=lat_from, stop=lat_to, num=num, endpoint=True)
+    lons = arange(lon_from, lon_to + step, step)
+    coords = column_stack([repeat(lons, num), tile(lats, len(lons))])
+    meridians_ = linestrings(coords, indices=repeat(arange(len(lons)), num))
+    labels = [f"LON {lon}" for lon in lons]
 
-    return labels, meridians_
+    return labels, meridians_.tolist()
 
 
 def parallels(lon_from: int | float,
@@ -110,16 +112,13 @@ def parallels(lon_from: int | float,
     except Exception as e:
         raise ValueError(f"Invalid longitude range: {e}") from e
 
-    labels, parallels_ = [], []
-    coords_lon = linspace(start=lon_from, stop=lon_to, num=num, endpoint=True).tolist()
-    for lat in arange(lat_from, lat_to + step, step):
-        labels.append(f"LAT {lat}")
-        coords_lat = full((len(coords_lon)), lat).tolist()
-        coords_parallel = list(zip(coords_lon, coords_lat))
-        parallel = LineString(coords_parallel)
-        parallels_.append(parallel)
+    lons = linspace(start=lon_from, stop=lon_to, num=num, endpoint=True)
+    lats = arange(lat_from, lat_to + step, step)
+    coords = column_stack([tile(lons, len(lats)), repeat(lats, num)])
+    parallels_ = linestrings(coords, indices=repeat(arange(len(lats)), num))
+    labels = [f"LAT {lat}" for lat in lats]
 
-    return labels, parallels_
+    return labels, parallels_.tolist()
 
 
 def parse_args() -> argparse.Namespace:
@@ -10,7 +10,12 @@ from dacite import (
 )
 import geopandas as gpd
 import pandas as pd
-from yaml import safe_load
+from yaml import load as yaml_load
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
 
 @dataclass(frozen=True)
@@ -36,7 +41,7 @@ def load_config(path: str = "config.yml") -> Configuration | Exception:
     """
     try:
         with open(path, "r", encoding="utf-8") as f:
-            content = safe_load(f)
+            content = yaml_load(f, Loader=_Loader)
             return from_dict(
                 data_class=Configuration,
                 data=content
@@ -111,14 +116,17 @@ def to_geodata_frame(path: str,
     """
     df = pd.read_csv(
         path,
-        delimiter=r"\s",
+        sep=r"\s+",
         names=columns,
-        skiprows=config.header_rows
+        skiprows=config.header_rows,
+        engine="c"
+    )
+    return gpd.GeoDataFrame(
+        df,
+        geometry=gpd.points_from_xy(x=df[config.coordinates.lon],
+                                    y=df[config.coordinates.lat]),
+        crs="EPSG:4326"
     )
-    df["geometry"] = gpd.GeoSeries.from_xy(x=df[config.coordinates.lon],
-                                           y=df[config.coordinates.lat],
-                                           crs="EPSG:4326")
-    return gpd.GeoDataFrame(df)
 
 
 def parse_args() -> argparse.Namespace:
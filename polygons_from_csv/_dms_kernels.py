@@ -0,0 +1,87 @@
+"""Numba kernels converting compacted HDMS or DMSH coordinates to decimal degrees (DD).
+Imported on first use by `polygons_from_csv.parse_coords_vectorized`.
+"""
+from numba import njit, prange
+import numpy as np
+
+
+@njit("void(uint8[:, :], int64, int8[:], int64[:], int64[:], float64[:], int8[:])",
+      parallel=True,
+      cache=True)
+def parse_compacted(buf, deg_digits, hem_sign, deg, minutes, sec, sign):
+    """Parse compacted HDMS or DMSH coordinates by fixed offsets into the `dms_to_dd` input arrays.
+
+    :param buf: ASCII coordinates, one per row, padded with NUL bytes
+    :param deg_digits: number of degrees digits: 2 for latitude, 3 for longitude
+    :param hem_sign: hemisphere sign by character code, 0 for not hemisphere character
+    :param deg: degrees, -1 when not parsed
+    :param minutes: minutes, -1 when not parsed
+    :param sec: seconds, NaN when not parsed
+    :param sign: hemisphere sign: 1, -1, 0 when both hemisphere prefix and suffix are set
+    """
+    for i in prange(buf.shape[0]):  # pylint: disable=not-an-iterable
+        row = buf[i]
+        deg[i], minutes[i], sec[i], sign[i] = -1, -1, np.nan, 1
+
+        start, end = 0, row.shape[0]
+        while end > 0 and row[end - 1] == 0:
+            end -= 1
+        hem_prefix = hem_sign[row[start]] if end > start else 0
+        if hem_prefix != 0:
+            sign[i] = hem_prefix
+            start += 1
+        hem_suffix = hem_sign[row[end - 1]] if end > start else 0
+        if hem_suffix != 0:
+            sign[i] = 0 if hem_prefix != 0 else hem_suffix
+            end -= 1
+
+        # DDMMSS or DDDMMSS, optionally followed by '.' and seconds fraction digits
+        sec_end = start + deg_digits + 4
+        if end < sec_end or (end > sec_end and (row[sec_end] != ord(".") or end == sec_end + 1)):
+            continue
+        digits = True
+        for j in range(start, end):
+            if j != sec_end and not ord("0") <= row[j] <= ord("9"):
+                digits = False
+        if not digits:
+            continue
+
+        d = 0
+        for j in range(start, start + deg_digits):
+            d = d * 10 + int(row[j]) - ord("0")
+        m = (int(row[start + deg_digits]) - ord("0")) * 10 \
+            + int(row[start + deg_digits + 1]) - ord("0")
+        # seconds as integer / power of 10 - exact as float parsing for up to 13 fraction digits
+        s = (int(row[sec_end - 2]) - ord("0")) * 10 + int(row[sec_end - 1]) - ord("0")
+        scale = 1
+        for j in range(sec_end + 1, min(end, sec_end + 14)):
+            s = s * 10 + int(row[j]) - ord("0")
+            scale *= 10
+        deg[i], minutes[i], sec[i] = d, m, s / scale
+
+
+@njit("void(int64[:], int64[:], float64[:], int8[:], int64, float64[:], boolean[:])",
+      parallel=True,
+      cache=True)
+def dms_to_dd(deg, minutes, sec, sign, max_deg, out, valid):
+    """Write coordinates in decimal degrees (DD) format into out array,
+    NaN for incorrect coordinate.
+
+    :param deg: degrees, -1 when not parsed
+    :param minutes: minutes, -1 when not parsed
+    :param sec: seconds, NaN when not parsed
+    :param sign: hemisphere sign: 1, -1, 0 when both hemisphere prefix and suffix are set
+    :param max_deg: maximum degrees value: 90 for latitude, 180 for longitude
+    :param out: decimal degrees
+    :param valid: True for correct coordinate
+    """
+    for i in prange(deg.shape[0]):  # pylint: disable=not-an-iterable
+        d, m, s = deg[i], minutes[i], sec[i]
+        # hemisphere prefix and suffix cannot be both set
+        # degrees within range <0, max_deg>
+        # minutes and seconds  within range <0, 60)
+        if sign[i] == 0 or not 0 <= d <= max_deg or not 0 <= m < 60 or not 0 <= s < 60 \
+                or (d == max_deg and (m != 0 or s != 0)):
+            out[i], valid[i] = np.nan, False
+        else:
+            out[i], valid[i] = sign[i] * (d + (m + s / 60) / 60), True
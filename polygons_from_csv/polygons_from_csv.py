@@ -8,17 +8,24 @@ Input data file:
     lat: latitude
     lon: longitude
 """
-from typing import Literal
+from __future__ import annotations
+from typing import Literal, TYPE_CHECKING
 import re
 
 import numpy as np
-import geopandas as gpd
 import pandas as pd
-from shapely import Polygon
 
+if TYPE_CHECKING:
+    import geopandas as gpd
 
-NEGATIVE_SIGN = ["S", "W"]
 
+NEGATIVE_SIGN = frozenset(("S", "W"))
+
+# Compacted HDMS or DMSH coordinate format specification.
+# Coordinates are parsed by fixed offsets (`_split_compacted`, `_dms_kernels.parse_compacted`),
+# patterns are matched only when the coordinate is not recognised that way
+# (example non-ASCII digits, `parse_coords_vectorized` passes such coordinates
+# to the scalar functions).
 LONGITUDE_COMPACTED_PATTERN = re.compile(
     r"""^(?P<hem_prefix>[EW])?
          (?P<deg>\d{3})
@@ -37,6 +44,33 @@ LATITUDE_COMPACTED_PATTERN = re.compile(
     re.VERBOSE
 )
 
+# Compacted format parameters:
+# degrees digits, positive hemisphere, negative hemisphere, maximum degrees
+_COMPACTED_FORMAT = {
+    "Latitude": (2, "N", "S", 90),
+    "Longitude": (3, "E", "W", 180),
+}
+
+
+def _hemisphere_sign_table(hem_pos: str, hem_neg: str) -> np.ndarray:
+    """Return hemisphere sign by character code:
+    1 positive, -1 negative, 0 not a hemisphere character.
+
+    :param hem_pos: positive hemisphere character
+    :param hem_neg: negative hemisphere character
+    :return: sign lookup table, indexed by ASCII character code
+    """
+    table = np.zeros(256, dtype=np.int8)
+    table[ord(hem_pos)] = 1
+    table[ord(hem_neg)] = -1
+    return table
+
+
+_HEMISPHERE_SIGN = {
+    coordinate_type: _hemisphere_sign_table(hem_pos, hem_neg)
+    for coordinate_type, (_, hem_pos, hem_neg, _) in _COMPACTED_FORMAT.items()
+}
+
 
 class CoordinateError(Exception):
     """Raised when:
@@ -53,91 +87,165 @@ class CoordinateError(Exception):
         return self.message
 
 
-def coordinate_exception(func):
-    """Handle coordinate conversion exception (not supported format, incorrect coordinate)"""
-    def wrapper(coord):
-        try:
-            return func(coord)
-        except CoordinateError as e:
-            print(f"{e}: {coord}")
-            return np.nan
-    return wrapper
+def _coordinate_error(coordinate_type: Literal["Latitude", "Longitude"], strict: bool) -> float:
+    """Return NaN for not supported format or incorrect coordinate, raise CoordinateError if strict.
 
+    :param coordinate_type: Latitude or Longitude
+    :param strict: raise CoordinateError instead of returning NaN
+    :return: NaN
+    """
+    if strict:
+        raise CoordinateError(coordinate_type)
+    return np.nan
+
+
+def _split_compacted(coord: str,
+                     coordinate_type: Literal["Latitude", "Longitude"]) -> tuple | None:
+    """Split compacted HDMS or DMSH coordinate by fixed offsets into the parts defined
+    by the LATITUDE_COMPACTED_PATTERN, LONGITUDE_COMPACTED_PATTERN groups.
+
+    :param coord: coordinate in HDMS or DMSH compacted format
+    :param coordinate_type: Latitude or Longitude
+    :return: hemisphere prefix, degrees, minutes, seconds, hemisphere suffix;
+        None if coordinate is not recognised
+    """
+    deg_digits, hem_pos, hem_neg, _ = _COMPACTED_FORMAT[coordinate_type]
+    hem_prefix = hem_suffix = None
+    if coord[:1] in (hem_pos, hem_neg):
+        hem_prefix, coord = coord[0], coord[1:]
+    if coord[-1:] in (hem_pos, hem_neg):
+        hem_suffix, coord = coord[-1], coord[:-1]
+
+    sec_end = deg_digits + 4
+    dms, sec_fraction = coord[:sec_end], coord[sec_end:]
+    if len(dms) != sec_end or not (dms.isascii() and dms.isdigit()):
+        return None
+    fraction_digits = sec_fraction[1:]
+    if sec_fraction and not (sec_fraction[:1] == "." and fraction_digits.isascii()
+                             and fraction_digits.isdigit()):
+        return None
+    deg, min_, sec = dms[:deg_digits], dms[deg_digits:deg_digits + 2], dms[deg_digits + 2:]
+    return hem_prefix, deg, min_, sec + sec_fraction, hem_suffix
 
-@coordinate_exception
-def longitude_to_dd(lon: str) -> float:
+
+def longitude_to_dd(lon: str, strict: bool = False) -> float:
     """Return longitude in decimal degrees (DD) format.
-    Raise CoordinateValueError when there is error in coordinate (example minute is out of range <0, 60)
-    or coordinate is in not supported format.
+    Return NaN (raise CoordinateError if strict) when there is error in coordinate
+    (example minute is out of range <0, 60) or coordinate is in not supported format.
 
     :param lon: longitude in HDMS or DMSH compacted or space delimited format
+    :param strict: raise CoordinateError instead of returning NaN
     :return: decimal degrees
     """
-    match = re.match(LONGITUDE_COMPACTED_PATTERN, lon)
-    if not match:
-        raise CoordinateError("Longitude")
+    parts = _split_compacted(lon, "Longitude")
+    if parts is None:
+        match = LONGITUDE_COMPACTED_PATTERN.match(lon)
+        if not match:
+            return _coordinate_error("Longitude", strict)
+        # groups: hem_prefix, deg, min, sec, hem_suffix
+        parts = match.groups()
+    hem_prefix, deg, min_, sec, hem_suffix = parts
 
-    h = match.group("hem_prefix") or match.group("hem_suffix")
-    d = int(match.group("deg"))
-    m = int(match.group("min"))
-    s = float(match.group("sec"))
+    h = hem_prefix or hem_suffix
+    d = int(deg)
+    m = int(min_)
+    s = float(sec)
 
     # hemisphere prefix and suffix cannot be both set
     # degrees within range <0, 180>
     # minutes and seconds  within range <0, 60)
-    if any(
-        [
-            (match.group("hem_prefix") and match.group("hem_suffix")),
-            not 0 <= d <= 180,
-            not 0 <= m < 60,
-            not 0 <= s < 60,
-            d == 180 and (m != 0 or s != 0)
-        ]
-    ):
-        raise CoordinateError("Longitude")
+    if (hem_prefix and hem_suffix) or not 0 <= d <= 180 or not 0 <= m < 60 or not 0 <= s < 60 \
+            or (d == 180 and (m != 0 or s != 0)):
+        return _coordinate_error("Longitude", strict)
 
     dd = d + (m + s / 60) / 60
-    if h in NEGATIVE_SIGN:
-        return -dd
-    return dd
+    return (-1.0 if h in NEGATIVE_SIGN else 1.0) * dd
 
 
-@coordinate_exception
-def latitude_to_dd(lat: str) -> float:
+def latitude_to_dd(lat: str, strict: bool = False) -> float:
     """Return latitude in decimal degrees (DD) format.
-    Raise CoordinateValueError when there is error in coordinate (example minute is out of range <0, 60)
-    or coordinate is in not supported format.
+    Return NaN (raise CoordinateError if strict) when there is error in coordinate
+    (example minute is out of range <0, 60) or coordinate is in not supported format.
 
     :param lat: latitude in HDMS or DMSH compacted or space delimited format
+    :param strict: raise CoordinateError instead of returning NaN
     :return: decimal degrees
     """
-    match = re.match(LATITUDE_COMPACTED_PATTERN, lat)
-    if not match:
-        raise CoordinateError("Latitude")
+    parts = _split_compacted(lat, "Latitude")
+    if parts is None:
+        match = LATITUDE_COMPACTED_PATTERN.match(lat)
+        if not match:
+            return _coordinate_error("Latitude", strict)
+        # groups: hem_prefix, deg, min, sec, hem_suffix
+        parts = match.groups()
+    hem_prefix, deg, min_, sec, hem_suffix = parts
 
-    h = match.group("hem_prefix") or match.group("hem_suffix")
-    d = int(match.group("deg"))
-    m = int(match.group("min"))
-    s = float(match.group("sec"))
+    h = hem_prefix or hem_suffix
+    d = int(deg)
+    m = int(min_)
+    s = float(sec)
 
     # hemisphere prefix and suffix cannot be both set
     # degrees within range <0, 90>
     # minutes and seconds  within range <0, 60)
-    if any(
-        [
-            (match.group("hem_prefix") and match.group("hem_suffix")),
-            not 0 <= d <= 90,
-            not 0 <= m < 60,
-            not 0 <= s < 60,
-            d == 90 and (m != 0 or s != 0)
-        ]
-    ):
-        raise CoordinateError("Latitude")
+    if (hem_prefix and hem_suffix) or not 0 <= d <= 90 or not 0 <= m < 60 or not 0 <= s < 60 \
+            or (d == 90 and (m != 0 or s != 0)):
+        return _coordinate_error("Latitude", strict)
 
     dd = d + (m + s / 60) / 60
-    if h in NEGATIVE_SIGN:
-        return -dd
-    return dd
+    return (-1.0 if h in NEGATIVE_SIGN else 1.0) * dd
+
+
+def parse_coords_vectorized(
+        coords: pd.Series,
+        coordinate_type: Literal["Latitude", "Longitude"]
+) -> tuple[pd.Series, np.ndarray]:
+    """Return coordinates in decimal degrees (DD) format, vectorized counterpart of
+    the `latitude_to_dd`, `longitude_to_dd`.
+    Coordinates in not supported format or with error
+    (example minute is out of range <0, 60)) are NaN.
+
+    :param coords: coordinates in HDMS or DMSH compacted format
+    :param coordinate_type: Latitude or Longitude
+    :return: decimal degrees, mask of correct coordinates
+    """
+    # compiled (or loaded from cache) on first use, so the scalar functions do not need Numba
+    from _dms_kernels import dms_to_dd, parse_compacted  # pylint: disable=import-outside-toplevel
+
+    deg_digits, _, _, max_deg = _COMPACTED_FORMAT[coordinate_type]
+    values = coords.to_numpy(dtype=str)
+    # non-ASCII characters are replaced with '?', such coordinates are converted below, one by one
+    buf = np.char.encode(values, "ascii", "replace")
+    buf = buf.view(np.uint8).reshape(len(buf), buf.dtype.itemsize)
+
+    n = len(coords)
+    deg = np.empty(n, dtype=np.int64)
+    minutes = np.empty(n, dtype=np.int64)
+    sec = np.empty(n, dtype=np.float64)
+    sign = np.empty(n, dtype=np.int8)
+    parse_compacted(buf, deg_digits, _HEMISPHERE_SIGN[coordinate_type], deg, minutes, sec, sign)
+
+    dd = np.empty(n, dtype=np.float64)
+    valid = np.empty(n, dtype=np.bool_)
+    dms_to_dd(deg, minutes, sec, sign, max_deg, dd, valid)
+
+    # coordinates with non-ASCII characters (example non-ASCII digits) are matched by the patterns
+    to_dd = latitude_to_dd if coordinate_type == "Latitude" else longitude_to_dd
+    for i in np.flatnonzero(~valid):
+        if not values[i].isascii():
+            dd[i] = to_dd(values[i])
+            valid[i] = not np.isnan(dd[i])
+    return pd.Series(dd, index=coords.index), valid
+
+
+def _normalize_coord(coord: str) -> str:
+    """Return coordinate 'normalized' to the compacted format:
+    upper case, without spaces, '.' as decimal separator.
+
+    :param coord: coordinate as it is in the data file
+    :return: normalized coordinate
+    """
+    return coord.upper().replace(" ", "").replace(",", ".")
 
 
 def create_polygons(data: str) -> gpd.GeoDataFrame:
@@ -146,34 +254,40 @@ def create_polygons(data: str) -> gpd.GeoDataFrame:
     :param data: path to CSV data file
     :return: geodata frame with polygons
     """
-    df = pd.read_csv(data, sep=";")
-    df.ffill(inplace=True)
+    # imported here, coordinates conversion does not need GeoPandas, Shapely
+    import geopandas as gpd  # pylint: disable=import-outside-toplevel
+    from shapely import linearrings, polygons  # pylint: disable=import-outside-toplevel
 
-    df["lat"] = df.apply(lambda row: row.lat.upper().replace(" ", "").replace(",", "."), axis=1)
-    df["lon"] = df.apply(lambda row: row.lon.upper().replace(" ", "").replace(",", "."), axis=1)
-    df["lat_dd"] = df.apply(lambda row: latitude_to_dd(row.lat), axis=1)
-    df["lon_dd"] = df.apply(lambda row: longitude_to_dd(row.lon), axis=1)
+    df = pd.read_csv(
+        data,
+        sep=";",
+        converters={"lat": _normalize_coord, "lon": _normalize_coord},
+        dtype={"name": "category"}
+    )
+    df["name"] = df["name"].ffill()
 
-    df_errors = df.loc[df.isnull().any(axis=1)]
-    errors = df_errors.name.unique()
-    df.drop(df.loc[df.name.isin(errors)].index, inplace=True)
+    lat_dd, lat_valid = parse_coords_vectorized(df["lat"], "Latitude")
+    lon_dd, lon_valid = parse_coords_vectorized(df["lon"], "Longitude")
+    df = df.assign(lat_dd=lat_dd, lon_dd=lon_dd)
+    for lat in df.loc[~lat_valid, "lat"]:
+        print(f"{CoordinateError('Latitude')}: {lat}")
+    for lon in df.loc[~lon_valid, "lon"]:
+        print(f"{CoordinateError('Longitude')}: {lon}")
+
+    errors = df.loc[~(lat_valid & lon_valid), "name"].unique()
+    df = df.loc[~df.name.isin(errors)]
     errors = ",".join(errors)
     print(f"Following polygons will be skipped due to above coordinates errors: {errors}")
 
-    poly_names, poly_geoms = [], []
-
-    for asp_name in df.name.unique():
-        asp_data = df.loc[df.name == asp_name]
-        lon, lat = asp_data.lon_dd.to_list(), asp_data.lat_dd.to_list()
-        coords = list(zip(lon, lat))
-        geometry = Polygon(coords)
-
-        poly_names.append(asp_name)
-        poly_geoms.append(geometry)
+    # polygon index of each vertex, vertices ordered by polygon (stable - keeps vertices order)
+    codes, poly_names = pd.factorize(df.name, sort=False)
+    order = np.argsort(codes, kind="stable")
+    coords = np.column_stack([df.lon_dd.to_numpy(), df.lat_dd.to_numpy()])[order]
+    poly_geoms = polygons(linearrings(coords, indices=codes[order]))
 
     return gpd.GeoDataFrame(
         data={
-            "name": poly_names,
+            "name": poly_names.to_list(),
             "geometry": poly_geoms
         },
         geometry="geometry",